@@ -1,8 +1,22 @@
 from pyVim.connect import SmartConnect, Disconnect
-from pyVmomi import vim
+from pyVmomi import vim, vmodl
 import ssl
+import sys
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 
+# Resolved once instead of on every polling iteration / comparison
+TASK_SUCCESS = vim.TaskInfo.State.success
+TASK_DONE = frozenset([vim.TaskInfo.State.success, vim.TaskInfo.State.error])
+POWERED_ON = vim.VirtualMachinePowerState.poweredOn
+POWERED_OFF = vim.VirtualMachinePowerState.poweredOff
+
+# Separator lines used by the reports
+SEP40 = "-" * 40
+SEP50 = "-" * 50
+
 class PowerAction(Enum):
     """
     Enum for supported VM power operations.
@@ -11,9 +25,42 @@ class PowerAction(Enum):
     POWER_OFF = "power_off"
     REBOOT = "reboot"
 
+class VCenter:
+    """
+    Wraps a vCenter service instance for the lifetime of a session.
+
+    The ServiceContent is retrieved once on construction and reused by every
+    call, instead of issuing si.RetrieveContent() per operation. Container
+    views over VMs, datastores and hosts are likewise created once and
+    destroyed by close().
+    """
+    def __init__(self, si):
+        self.si = si
+        self.content = si.RetrieveContent()
+
+        view_manager = self.content.viewManager
+        root_folder = self.content.rootFolder
+        self.vm_view = view_manager.CreateContainerView(root_folder, [vim.VirtualMachine], True)
+        self.datastore_view = view_manager.CreateContainerView(root_folder, [vim.Datastore], True)
+        self.host_view = view_manager.CreateContainerView(root_folder, [vim.HostSystem], True)
+
+        # Filled lazily by get_first_datastore()
+        self.first_datastore = None
+
+    def close(self):
+        """
+        Destroys the cached container views and disconnects the session.
+        """
+        for view in (self.vm_view, self.datastore_view, self.host_view):
+            try:
+                view.Destroy()
+            except Exception as e:
+                print(f"⚠️ Failed to destroy container view: {e}")
+        Disconnect(self.si)
+
 def connect_to_vcenter(host="localhost", port=443, user="user", pwd="pass"):
     """
-    Connects to the vCenter server and returns a service instance (si).
+    Connects to the vCenter server and returns a VCenter session wrapper.
     Uses an unverified SSL context for simulator compatibility.
     """
     context = ssl._create_unverified_context()
@@ -27,13 +74,191 @@ def connect_to_vcenter(host="localhost", port=443, user="user", pwd="pass"):
             sslContext=context
         )
         print("✅ Connected to vCenter Simulator!")
-        return si
     except Exception as e:
         print("❌ Connection failed:", e)
         return None
 
+    try:
+        return VCenter(si)
+    except Exception as e:
+        print("❌ Session setup failed:", e)
+        Disconnect(si)
+        return None
+
+
+def _poll_task(task):
+    """
+    Polls a task until it finishes, sleeping with exponential backoff
+    (50 ms doubling up to 2 s) between reads of task.info.state.
+    """
+    delay = 0.05
+    while task.info.state not in TASK_DONE:
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+    return task.info.state
+
+
+def wait_for_task(vc, task):
+    """
+    Blocks until a vCenter task finishes.
+
+    Args:
+        vc: VCenter session.
+        task: Task object returned by a *_Task call.
+
+    Returns:
+        The final vim.TaskInfo.State (success or error).
+    """
+    return wait_for_tasks(vc, [task])[0]
+
+
+def wait_for_tasks(vc, tasks):
+    """
+    Blocks until all of the given vCenter tasks finish.
+
+    Registers a single PropertyCollector filter over every task's info.state
+    and waits with WaitForUpdatesEx, so the server notifies us of state
+    changes instead of us polling each task in a loop. Falls back to
+    _poll_task on servers that do not support it.
+
+    Args:
+        vc: VCenter session.
+        tasks (list): Task objects returned by *_Task calls.
+
+    Returns:
+        list: The final vim.TaskInfo.State of each task, in the same order.
+    """
+    if not tasks:
+        return []
+
+    obj_specs = [vmodl.query.PropertyCollector.ObjectSpec(obj=task) for task in tasks]
+    prop_spec = vmodl.query.PropertyCollector.PropertySpec(
+        type=vim.Task,
+        pathSet=["info.state", "info.error", "info.result"],
+        all=False
+    )
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(objectSet=obj_specs, propSet=[prop_spec])
+
+    pc = None
+    try:
+        # A private collector, so concurrent waits do not consume each other's updates
+        pc = vc.content.propertyCollector.CreatePropertyCollector()
+        pc.CreateFilter(filter_spec, True)
+
+        version = ""
+        states = {}
+        pending = set(tasks)
+        while pending:
+            update = pc.WaitForUpdatesEx(version)
+            if update is None:
+                continue
+            version = update.version
+            for filter_set in update.filterSet:
+                for obj_set in filter_set.objectSet:
+                    for change in obj_set.changeSet:
+                        if change.name == "info.state":
+                            states[obj_set.obj] = change.val
+                            if change.val in TASK_DONE:
+                                pending.discard(obj_set.obj)
+        return [states[task] for task in tasks]
+    except (vmodl.fault.NotSupported, vmodl.fault.MethodNotFound):
+        return [_poll_task(task) for task in tasks]
+    finally:
+        # Destroying the collector also destroys its filter
+        if pc:
+            pc.DestroyPropertyCollector()
+
+
+def collect_properties(vc, view_ref, obj_type, path_set, include_mors=False,
+                       traversal_path="view", traversal_type=vim.view.ContainerView):
+    """
+    Fetches properties for every object in a container view with a single
+    PropertyCollector.RetrieveContents call, instead of one round-trip per
+    attribute access.
+
+    Args:
+        vc: VCenter session.
+        view_ref: ContainerView whose objects should be collected, or any
+            object reachable through traversal_path.
+        obj_type: Managed object type to collect, e.g. vim.VirtualMachine.
+        path_set (list): Property paths to retrieve, e.g. ["name"].
+        include_mors (bool): If True, each dict also holds the managed object under "obj".
+        traversal_path (str): Property of view_ref holding the objects to collect.
+        traversal_type: Managed object type of view_ref.
+
+    Returns:
+        list: One dict per object mapping property path to value.
+    """
+    collector = vc.content.propertyCollector
+
+    traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+        name="traverseEntities",
+        path=traversal_path,
+        skip=False,
+        type=traversal_type
+    )
+    obj_spec = vmodl.query.PropertyCollector.ObjectSpec(obj=view_ref, skip=True, selectSet=[traversal_spec])
+    prop_spec = vmodl.query.PropertyCollector.PropertySpec(type=obj_type, pathSet=path_set, all=False)
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(objectSet=[obj_spec], propSet=[prop_spec])
+
+    results = []
+    for obj_content in collector.RetrieveContents([filter_spec]):
+        properties = {prop.name: prop.val for prop in obj_content.propSet}
+        if include_mors:
+            properties["obj"] = obj_content.obj
+        results.append(properties)
+    return results
+
+
+def get_vm_by_name(vc, vm_name):
+    """
+    Looks up a VM by name.
+
+    Fetches the names of all VMs in one PropertyCollector call, instead of
+    reading vm.name for each VM in turn. VM names need not be unique; the
+    first match wins.
+
+    Args:
+        vc: VCenter session.
+        vm_name (str): Name of the VM to find.
+
+    Returns:
+        VirtualMachine object if found, otherwise None.
+    """
+    vms = collect_properties(vc, vc.vm_view, vim.VirtualMachine, ["name"], include_mors=True)
+    return next((vm["obj"] for vm in vms if vm.get("name") == vm_name), None)
 
-def list_vms(si):
+
+def _write_lines(lines):
+    """
+    Writes report lines to stdout in a single call, instead of one print()
+    per line, so concurrently running reports do not interleave.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _vm_inventory_lines(vc):
+    """
+    Builds the lines of the VM inventory report.
+    """
+    vms = collect_properties(vc, vc.vm_view, vim.VirtualMachine, [
+        "summary.config.name",
+        "summary.runtime.powerState",
+        "summary.config.numCpu",
+        "summary.config.memorySizeMB"
+    ])
+
+    lines = ["\n📋 VM Inventory:"]
+    for vm in vms:
+        lines.append(f"Name: {vm.get('summary.config.name')}")
+        lines.append(f"Power State: {vm.get('summary.runtime.powerState')}")
+        lines.append(f"CPU: {vm.get('summary.config.numCpu')} vCPU")
+        lines.append(f"Memory: {vm.get('summary.config.memorySizeMB')} MB")
+        lines.append(SEP40)
+    return lines
+
+
+def list_vms(vc):
     """
     Lists all Virtual Machines (VMs) in the connected vCenter.
 
@@ -47,88 +272,73 @@ def list_vms(si):
         When using the nimmis/vcsim simulator, mock VMs like DC0_H0_VM0
         will appear even if you haven’t created them manually.
     """
-    if not si:
+    if not vc:
         print("No connection to vCenter.")
         return
 
-    content = si.RetrieveContent()
-    container = content.rootFolder
-    viewType = [vim.VirtualMachine]
-    containerView = content.viewManager.CreateContainerView(container, viewType, True)
-
-    print("\n📋 VM Inventory:")
-    for vm in containerView.view:
-        summary = vm.summary
-        print(f"Name: {summary.config.name}")
-        print(f"Power State: {summary.runtime.powerState}")
-        print(f"CPU: {summary.config.numCpu} vCPU")
-        print(f"Memory: {summary.config.memorySizeMB} MB")
-        print("-" * 40)
+    _write_lines(_vm_inventory_lines(vc))
 
 
-def get_first_datastore(si):
+def get_first_datastore(vc):
     """
     Retrieves the first datastore available in the environment.
+    The result is cached on the session, so repeated calls (e.g. from
+    create_vm) do not reload the datastore view.
 
     Args:
-        si: ServiceInstance object.
+        vc: VCenter session.
 
     Returns:
         Datastore object if found, otherwise None.
     """
-    content = si.RetrieveContent()
-    containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.Datastore], True)
+    if vc.first_datastore is not None:
+        return vc.first_datastore
 
-    datastores = containerView.view
+    datastores = vc.datastore_view.view
     if datastores:
         print(f"✅ Found datastore: {datastores[0].name}")
-        return datastores[0]
+        vc.first_datastore = datastores[0]
+        return vc.first_datastore
     else:
         print("❌ No datastore found.")
         return None
 
 
-def vm_exists(si, vm_name):
+def vm_exists(vc, vm_name):
     """
     Checks if a VM with the given name exists.
 
     Args:
-        si: ServiceInstance object.
+        vc: VCenter session.
         vm_name (str): Name of the VM to check.
 
     Returns:
         bool: True if VM exists, False otherwise.
     """
-    content = si.RetrieveContent()
-    containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
-
-    for vm in containerView.view:
-        if vm.name == vm_name:
-            return True
-    return False
+    return get_vm_by_name(vc, vm_name) is not None
 
 
-def create_vm(si, vm_name="Shital_TestVM"):
+def create_vm(vc, vm_name="Shital_TestVM"):
     """
     Creates a new VM in the vCenter environment.
 
     Args:
-        si: ServiceInstance object.
+        vc: VCenter session.
         vm_name (str): Name of the new VM.
 
     Returns:
         Task object representing the VM creation.
     """
     try:
-        if vm_exists(si, vm_name):
+        if vm_exists(vc, vm_name):
             print(f"⚠️ VM '{vm_name}' already exists. Skipping creation.")
             return None
 
-        content = si.RetrieveContent()
+        content = vc.content
         datacenter = content.rootFolder.childEntity[0]
         vm_folder = datacenter.vmFolder
         resource_pool = datacenter.hostFolder.childEntity[0].resourcePool
-        datastore = get_first_datastore(si)
+        datastore = get_first_datastore(vc)
 
         vm_config = vim.vm.ConfigSpec(
             name=vm_name,
@@ -141,10 +351,9 @@ def create_vm(si, vm_name="Shital_TestVM"):
         print(f"Creating VM: {vm_name}")
         task = vm_folder.CreateVM_Task(config=vm_config, pool=resource_pool)
 
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            continue
+        state = wait_for_task(vc, task)
 
-        if task.info.state == vim.TaskInfo.State.success:
+        if state == TASK_SUCCESS:
             print(f"✅ VM '{vm_name}' created successfully.")
         else:
             print(f"❌ VM creation failed: {task.info.error.msg}")
@@ -155,232 +364,221 @@ def create_vm(si, vm_name="Shital_TestVM"):
     return None
 
 
-def delete_vm(si, vm_name):
+def delete_vm(vc, vm_name):
     """
     Deletes a VM from the vCenter environment.
 
     Args:
-        si: ServiceInstance object.
+        vc: VCenter session.
         vm_name (str): Name of the VM to delete.
 
     Returns:
         Task object if deletion initiated, otherwise None.
     """
-    content = si.RetrieveContent()
-    containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
-
-    for vm in containerView.view:
-        if vm.name == vm_name:
-            print(f"🗑️ Deleting VM: {vm_name}")
-            return vm.Destroy_Task()
+    vm = get_vm_by_name(vc, vm_name)
+    if vm:
+        print(f"🗑️ Deleting VM: {vm_name}")
+        return vm.Destroy_Task()
 
     print(f"⚠️ VM '{vm_name}' not found.")
     return None
 
-def control_vm_power(si, vm_name, action: PowerAction):
+def control_vm_power(vc, vm_name, action: PowerAction):
     """
     Controls the power state of a VM.
     action: PowerAction Enum (POWER_ON, POWER_OFF, REBOOT)
     """
-    content = si.RetrieveContent()
-    container = content.rootFolder
-    viewType = [vim.VirtualMachine]
-    recursive = True
-    containerView = content.viewManager.CreateContainerView(container, viewType, recursive)
-
-    for vm in containerView.view:
-        if vm.name == vm_name:
-            try:
-                if action == PowerAction.POWER_ON:
-                    if vm.runtime.powerState != vim.VirtualMachinePowerState.poweredOn:
-                        print(f"🔌 Powering ON VM: {vm_name}")
-                        task = vm.PowerOn()
-                    else:
-                        print(f"⚠️ VM '{vm_name}' is already powered on.")
-                elif action == PowerAction.POWER_OFF:
-                    if vm.runtime.powerState != vim.VirtualMachinePowerState.poweredOff:
-                        print(f"⏻ Powering OFF VM: {vm_name}")
-                        task = vm.PowerOff()
-                    else:
-                        print(f"⚠️ VM '{vm_name}' is already powered off.")
-                elif action == PowerAction.REBOOT:
-                    if vm.runtime.powerState == vim.VirtualMachinePowerState.poweredOn:
-                        print(f"🔄 Rebooting VM: {vm_name}")
-                        vm.PowerOff()
-                        vm.PowerOn()
-                    else:
-                        print(f"⚠️ Cannot reboot. VM '{vm_name}' is not powered on.")
+    vm = get_vm_by_name(vc, vm_name)
+    if vm:
+        try:
+            if action == PowerAction.POWER_ON:
+                if vm.runtime.powerState != POWERED_ON:
+                    print(f"🔌 Powering ON VM: {vm_name}")
+                    task = vm.PowerOn()
                 else:
-                    print(f"❌ Unknown action: {action}")
-                return
-            except Exception as e:
-                print(f"❌ Failed to {action.value} VM '{vm_name}': {e}")
-                return
-    print(f"❌ VM '{vm_name}' not found.")
-
-def take_snapshot(si, vm_name, snapshot_name="Snapshot1", description="Snapshot created by script"):
-    content = si.RetrieveContent()
-    containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
-
-    for vm in containerView.view:
-        if vm.name == vm_name:
-            try:
-                print(f"📸 Taking snapshot of VM: {vm_name}")
-                task = vm.CreateSnapshot_Task(
-                    name=snapshot_name,
-                    description=description,
-                    memory=False,
-                    quiesce=False
-                )
-                while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                    continue
-                if task.info.state == vim.TaskInfo.State.success:
-                    print(f"✅ Snapshot '{snapshot_name}' created successfully.")
+                    print(f"⚠️ VM '{vm_name}' is already powered on.")
+            elif action == PowerAction.POWER_OFF:
+                if vm.runtime.powerState != POWERED_OFF:
+                    print(f"⏻ Powering OFF VM: {vm_name}")
+                    task = vm.PowerOff()
                 else:
-                    print(f"❌ Snapshot creation failed: {task.info.error.msg}")
-                return
-            except Exception as e:
-                print(f"❌ Failed to take snapshot: {e}")
-                return
+                    print(f"⚠️ VM '{vm_name}' is already powered off.")
+            elif action == PowerAction.REBOOT:
+                if vm.runtime.powerState == POWERED_ON:
+                    print(f"🔄 Rebooting VM: {vm_name}")
+                    # Single server-side hard reset instead of PowerOff + PowerOn
+                    task = vm.ResetVM_Task()
+                    if wait_for_task(vc, task) != TASK_SUCCESS:
+                        print(f"❌ Reboot failed: {task.info.error.msg}")
+                else:
+                    print(f"⚠️ Cannot reboot. VM '{vm_name}' is not powered on.")
+            else:
+                print(f"❌ Unknown action: {action}")
+            return
+        except Exception as e:
+            print(f"❌ Failed to {action.value} VM '{vm_name}': {e}")
+            return
     print(f"❌ VM '{vm_name}' not found.")
 
-def revert_to_snapshot(si, vm_name, snapshot_name="Snapshot1"):
-    content = si.RetrieveContent()
-    containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
+def _flatten_snapshots(trees, snapshots=None):
+    """
+    Indexes a snapshot tree by name, including nested child snapshots.
+    Snapshot names need not be unique; the first match in tree order wins.
 
-    for vm in containerView.view:
-        if vm.name == vm_name and vm.snapshot:
-            try:
-                for tree in vm.snapshot.rootSnapshotList:
-                    if tree.name == snapshot_name:
-                        print(f"⏪ Reverting VM '{vm_name}' to snapshot '{snapshot_name}'")
-                        task = tree.snapshot.RevertToSnapshot_Task()
-                        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                            continue
-                        if task.info.state == vim.TaskInfo.State.success:
-                            print(f"✅ Reverted to snapshot '{snapshot_name}'")
-                        else:
-                            print(f"❌ Revert failed: {task.info.error.msg}")
-                        return
-                print(f"⚠️ Snapshot '{snapshot_name}' not found.")
-            except Exception as e:
-                print(f"❌ Error reverting to snapshot: {e}")
-            return
-    print(f"❌ VM '{vm_name}' not found or has no snapshots.")
+    Args:
+        trees (list): SnapshotTree objects, e.g. vm.snapshot.rootSnapshotList.
+        snapshots (dict): Index to fill; a new one is created if omitted.
 
-def clone_vm_from_snapshot(si, source_vm_name, clone_name):
-    content = si.RetrieveContent()
-    containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
+    Returns:
+        dict: Snapshot name mapped to its SnapshotTree.
+    """
+    if snapshots is None:
+        snapshots = {}
+    for tree in trees:
+        snapshots.setdefault(tree.name, tree)
+        _flatten_snapshots(tree.childSnapshotList, snapshots)
+    return snapshots
+
+def take_snapshot(vc, vm_name, snapshot_name="Snapshot1", description="Snapshot created by script"):
+    vm = get_vm_by_name(vc, vm_name)
+    if vm:
+        try:
+            print(f"📸 Taking snapshot of VM: {vm_name}")
+            task = vm.CreateSnapshot_Task(
+                name=snapshot_name,
+                description=description,
+                memory=False,
+                quiesce=False
+            )
+            state = wait_for_task(vc, task)
+            if state == TASK_SUCCESS:
+                print(f"✅ Snapshot '{snapshot_name}' created successfully.")
+            else:
+                print(f"❌ Snapshot creation failed: {task.info.error.msg}")
+            return
+        except Exception as e:
+            print(f"❌ Failed to take snapshot: {e}")
+            return
+    print(f"❌ VM '{vm_name}' not found.")
 
-    for vm in containerView.view:
-        if vm.name == source_vm_name and vm.snapshot:
-            try:
-                relocate_spec = vim.vm.RelocateSpec()
-                clone_spec = vim.vm.CloneSpec(
-                    location=relocate_spec,
-                    powerOn=False,
-                    template=False,
-                    snapshot=vm.snapshot.currentSnapshot
-                )
-
-                datacenter = content.rootFolder.childEntity[0]
-                vm_folder = datacenter.vmFolder
-
-                print(f"🧬 Cloning VM '{source_vm_name}' to '{clone_name}' from snapshot")
-                task = vm.Clone(folder=vm_folder, name=clone_name, spec=clone_spec)
-                while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                    continue
-                if task.info.state == vim.TaskInfo.State.success:
-                    print(f"✅ Clone '{clone_name}' created successfully.")
+def revert_to_snapshot(vc, vm_name, snapshot_name="Snapshot1"):
+    vm = get_vm_by_name(vc, vm_name)
+    if vm and vm.snapshot:
+        try:
+            tree = _flatten_snapshots(vm.snapshot.rootSnapshotList).get(snapshot_name)
+            if tree:
+                print(f"⏪ Reverting VM '{vm_name}' to snapshot '{snapshot_name}'")
+                task = tree.snapshot.RevertToSnapshot_Task()
+                state = wait_for_task(vc, task)
+                if state == TASK_SUCCESS:
+                    print(f"✅ Reverted to snapshot '{snapshot_name}'")
                 else:
-                    print(f"❌ Clone failed: {task.info.error.msg}")
+                    print(f"❌ Revert failed: {task.info.error.msg}")
                 return
-            except Exception as e:
-                print(f"❌ Error cloning VM: {e}")
+            print(f"⚠️ Snapshot '{snapshot_name}' not found.")
+        except Exception as e:
+            print(f"❌ Error reverting to snapshot: {e}")
+        return
+    print(f"❌ VM '{vm_name}' not found or has no snapshots.")
+
+def clone_vm_from_snapshot(vc, source_vm_name, clone_name):
+    vm = get_vm_by_name(vc, source_vm_name)
+    if vm and vm.snapshot:
+        try:
+            relocate_spec = vim.vm.RelocateSpec()
+            clone_spec = vim.vm.CloneSpec(
+                location=relocate_spec,
+                powerOn=False,
+                template=False,
+                snapshot=vm.snapshot.currentSnapshot
+            )
+
+            datacenter = vc.content.rootFolder.childEntity[0]
+            vm_folder = datacenter.vmFolder
+
+            print(f"🧬 Cloning VM '{source_vm_name}' to '{clone_name}' from snapshot")
+            task = vm.Clone(folder=vm_folder, name=clone_name, spec=clone_spec)
+            state = wait_for_task(vc, task)
+            if state == TASK_SUCCESS:
+                print(f"✅ Clone '{clone_name}' created successfully.")
+            else:
+                print(f"❌ Clone failed: {task.info.error.msg}")
             return
+        except Exception as e:
+            print(f"❌ Error cloning VM: {e}")
+        return
     print(f"❌ Source VM '{source_vm_name}' not found or has no snapshots.")
 
-def compare_vm_to_snapshot(si, vm_name, snapshot_name="Snapshot1"):
-    content = si.RetrieveContent()
-    containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
-
-    for vm in containerView.view:
-        if vm.name == vm_name and vm.snapshot:
-            try:
-                for tree in vm.snapshot.rootSnapshotList:
-                    if tree.name == snapshot_name:
-                        snap_config = tree.config
-                        current_config = vm.config
-
-                        print(f"🔍 Comparing VM '{vm_name}' to snapshot '{snapshot_name}'")
-                        print(f"- CPU: {current_config.hardware.numCPU} vs Snapshot: {snap_config.hardware.numCPU}")
-                        print(f"- Memory: {current_config.hardware.memoryMB} MB vs Snapshot: {snap_config.hardware.memoryMB} MB")
-                        # You can add more comparisons here
-                        return
-                print(f"⚠️ Snapshot '{snapshot_name}' not found.")
-            except Exception as e:
-                print(f"❌ Error comparing VM to snapshot: {e}")
-            return
+def compare_vm_to_snapshot(vc, vm_name, snapshot_name="Snapshot1"):
+    vm = get_vm_by_name(vc, vm_name)
+    if vm and vm.snapshot:
+        try:
+            tree = _flatten_snapshots(vm.snapshot.rootSnapshotList).get(snapshot_name)
+            if tree:
+                snap_config = tree.snapshot.config
+                current_config = vm.config
+
+                print(f"🔍 Comparing VM '{vm_name}' to snapshot '{snapshot_name}'")
+                print(f"- CPU: {current_config.hardware.numCPU} vs Snapshot: {snap_config.hardware.numCPU}")
+                print(f"- Memory: {current_config.hardware.memoryMB} MB vs Snapshot: {snap_config.hardware.memoryMB} MB")
+                # You can add more comparisons here
+                return
+            print(f"⚠️ Snapshot '{snapshot_name}' not found.")
+        except Exception as e:
+            print(f"❌ Error comparing VM to snapshot: {e}")
+        return
     print(f"❌ VM '{vm_name}' not found or has no snapshots.")
 
-def convert_vm_to_template(si, vm_name):
+def convert_vm_to_template(vc, vm_name):
     """
     Converts an existing VM to a template.
     """
-    content = si.RetrieveContent()
-    container = content.rootFolder
-    viewType = [vim.VirtualMachine]
-    recursive = True
-    containerView = content.viewManager.CreateContainerView(container, viewType, recursive)
-
-    for vm in containerView.view:
-        if vm.name == vm_name:
-            try:
-                print(f"Converting VM '{vm_name}' to template...")
-                vm.MarkAsTemplate()
-                print(f"✅ VM '{vm_name}' is now a template.")
-                return
-            except Exception as e:
-                print(f"❌ Failed to convert VM to template: {e}")
-                return
+    vm = get_vm_by_name(vc, vm_name)
+    if vm:
+        try:
+            print(f"Converting VM '{vm_name}' to template...")
+            vm.MarkAsTemplate()
+            print(f"✅ VM '{vm_name}' is now a template.")
+            return
+        except Exception as e:
+            print(f"❌ Failed to convert VM to template: {e}")
+            return
     print(f"❌ VM '{vm_name}' not found.")
 
-def clone_vm_from_template(si, template_name, new_vm_name, datacenter_name=None, datastore_name=None, resource_pool_name=None, power_on=True):
+def clone_vm_from_template(vc, template_name, new_vm_name, datacenter_name=None, datastore_name=None, resource_pool_name=None, power_on=True):
     """
     Clones a VM from a template with basic customization.
     """
-    content = si.RetrieveContent()
+    content = vc.content
+    search_index = content.searchIndex
 
     # Find the datacenter
-    datacenter = None
-    for dc in content.rootFolder.childEntity:
-        if not datacenter_name or dc.name == datacenter_name:
-            datacenter = dc
-            break
-    if not datacenter:
+    if datacenter_name:
+        datacenter = search_index.FindChild(content.rootFolder, datacenter_name)
+    else:
+        datacenters = content.rootFolder.childEntity
+        datacenter = datacenters[0] if datacenters else None
+    if not isinstance(datacenter, vim.Datacenter):
         print("❌ Datacenter not found.")
         return
 
     # Find the template VM
-    template_vm = None
-    for vm in datacenter.vmFolder.childEntity:
-        if isinstance(vm, vim.VirtualMachine) and vm.name == template_name:
-            template_vm = vm
-            break
-    if not template_vm:
+    template_vm = search_index.FindChild(datacenter.vmFolder, template_name)
+    if not isinstance(template_vm, vim.VirtualMachine):
         print(f"❌ Template '{template_name}' not found.")
         return
 
     # Find the datastore
-    datastore = None
     if datastore_name:
-        for ds in datacenter.datastore:
-            if ds.name == datastore_name:
-                datastore = ds
-                break
+        # datacenter.datastore also covers subfolders and datastore clusters
+        datastores = collect_properties(
+            vc, datacenter, vim.Datastore, ["name"], include_mors=True,
+            traversal_path="datastore", traversal_type=vim.Datacenter
+        )
+        datastore = next((ds["obj"] for ds in datastores if ds.get("name") == datastore_name), None)
     else:
-        datastore = get_first_datastore(si)
-    if not datastore:
+        datastore = get_first_datastore(vc)
+    if not isinstance(datastore, vim.Datastore):
         print("❌ Datastore not found.")
         return
 
@@ -388,10 +586,12 @@ def clone_vm_from_template(si, template_name, new_vm_name, datacenter_name=None,
     resource_pool = None
     if resource_pool_name:
         for cluster in datacenter.hostFolder.childEntity:
-            for rp in cluster.resourcePool.resourcePool:
-                if rp.name == resource_pool_name:
-                    resource_pool = rp
-                    break
+            if not isinstance(cluster, vim.ComputeResource):
+                continue
+            rp = search_index.FindChild(cluster.resourcePool, resource_pool_name)
+            if isinstance(rp, vim.ResourcePool):
+                resource_pool = rp
+                break
     else:
         resource_pool = datacenter.hostFolder.childEntity[0].resourcePool
 
@@ -409,177 +609,219 @@ def clone_vm_from_template(si, template_name, new_vm_name, datacenter_name=None,
     task = template_vm.Clone(folder=datacenter.vmFolder, name=new_vm_name, spec=clone_spec)
 
     # Wait for task to complete
-    while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-        continue
+    state = wait_for_task(vc, task)
 
-    if task.info.state == vim.TaskInfo.State.success:
+    if state == TASK_SUCCESS:
         print(f"✅ VM '{new_vm_name}' cloned successfully.")
     else:
         print(f"❌ Clone failed: {task.info.error.msg}")
 
-def list_datastores_with_space(si):
+def _datastore_inventory_lines(vc):
     """
-    Lists all datastores with their free and used space in GB.
+    Builds the lines of the datastore inventory report.
     """
-    if not si:
-        print("No connection to vCenter.")
-        return
-
-    content = si.RetrieveContent()
-    container = content.rootFolder
-    viewType = [vim.Datastore]
-    recursive = True
-    containerView = content.viewManager.CreateContainerView(container, viewType, recursive)
-
-    print("\n📦 Datastore Inventory:")
-    for datastore in containerView.view:
-        summary = datastore.summary
-        capacity_gb = summary.capacity / (1024 ** 3)
-        free_space_gb = summary.freeSpace / (1024 ** 3)
+    datastores = collect_properties(vc, vc.datastore_view, vim.Datastore, [
+        "summary.name",
+        "summary.capacity",
+        "summary.freeSpace"
+    ])
+
+    lines = ["\n📦 Datastore Inventory:"]
+    for datastore in datastores:
+        capacity_gb = datastore.get("summary.capacity", 0) / (1024 ** 3)
+        free_space_gb = datastore.get("summary.freeSpace", 0) / (1024 ** 3)
         used_space_gb = capacity_gb - free_space_gb
 
-        print(f"Name: {summary.name}")
-        print(f"  Capacity: {capacity_gb:.2f} GB")
-        print(f"  Free Space: {free_space_gb:.2f} GB")
-        print(f"  Used Space: {used_space_gb:.2f} GB")
-        print("-" * 40)
+        lines.append(f"Name: {datastore.get('summary.name')}")
+        lines.append(f"  Capacity: {capacity_gb:.2f} GB")
+        lines.append(f"  Free Space: {free_space_gb:.2f} GB")
+        lines.append(f"  Used Space: {used_space_gb:.2f} GB")
+        lines.append(SEP40)
+    return lines
 
-def report_esxi_hosts_health(si):
+
+def list_datastores_with_space(vc):
     """
-    Generates a report of all ESXi hosts and their health status.
+    Lists all datastores with their free and used space in GB.
     """
-    if not si:
+    if not vc:
         print("No connection to vCenter.")
         return
 
-    content = si.RetrieveContent()
-    container = content.rootFolder
-    viewType = [vim.HostSystem]
-    recursive = True
-    containerView = content.viewManager.CreateContainerView(container, viewType, recursive)
-
-    print("\n🖥️ ESXi Host Health Report:")
-    for host in containerView.view:
-        summary = host.summary
-        hardware = summary.hardware
-        runtime = summary.runtime
-        overall_status = summary.overallStatus
-
-        print(f"Host Name: {summary.config.name}")
-        print(f"  Manufacturer: {hardware.vendor}")
-        print(f"  Model: {hardware.model}")
-        print(f"  CPU: {hardware.cpuModel} ({hardware.numCpuPkgs} CPUs, {hardware.numCpuCores} cores)")
-        print(f"  Memory: {hardware.memorySize / (1024 ** 3):.2f} GB")
-        print(f"  Connection State: {runtime.connectionState}")
-        print(f"  Power State: {runtime.powerState}")
-        print(f"  Overall Health Status: {overall_status}")
-        print("-" * 50)
-
-def monitor_recent_vm_events(si, max_events=20):
+    _write_lines(_datastore_inventory_lines(vc))
+
+def _host_health_lines(vc):
     """
-    Monitors recent vCenter events related to VM power changes.
+    Builds the lines of the ESXi host health report.
+    """
+    hosts = collect_properties(vc, vc.host_view, vim.HostSystem, [
+        "summary.config.name",
+        "summary.hardware.vendor",
+        "summary.hardware.model",
+        "summary.hardware.cpuModel",
+        "summary.hardware.numCpuPkgs",
+        "summary.hardware.numCpuCores",
+        "summary.hardware.memorySize",
+        "summary.runtime.connectionState",
+        "summary.runtime.powerState",
+        "summary.overallStatus"
+    ])
+
+    lines = ["\n🖥️ ESXi Host Health Report:"]
+    for host in hosts:
+        lines.append(f"Host Name: {host.get('summary.config.name')}")
+        lines.append(f"  Manufacturer: {host.get('summary.hardware.vendor')}")
+        lines.append(f"  Model: {host.get('summary.hardware.model')}")
+        lines.append(f"  CPU: {host.get('summary.hardware.cpuModel')} ({host.get('summary.hardware.numCpuPkgs')} CPUs, {host.get('summary.hardware.numCpuCores')} cores)")
+        lines.append(f"  Memory: {host.get('summary.hardware.memorySize', 0) / (1024 ** 3):.2f} GB")
+        lines.append(f"  Connection State: {host.get('summary.runtime.connectionState')}")
+        lines.append(f"  Power State: {host.get('summary.runtime.powerState')}")
+        lines.append(f"  Overall Health Status: {host.get('summary.overallStatus')}")
+        lines.append(SEP50)
+    return lines
+
+
+def report_esxi_hosts_health(vc):
     """
-    if not si:
+    Generates a report of all ESXi hosts and their health status.
+    """
+    if not vc:
         print("No connection to vCenter.")
         return
 
-    content = si.RetrieveContent()
+    _write_lines(_host_health_lines(vc))
+
+def _vm_event_lines(vc, max_events=20, days=1):
+    """
+    Builds the lines of the recent VM power events report.
+    """
+    content = vc.content
     event_manager = content.eventManager
 
     # Get the latest events
+    lines = [f"\n📋 Recent VM Power Events (up to {max_events}):"]
     try:
-        print(f"\n📋 Recent VM Power Events (up to {max_events}):")
-        event_filter = vim.event.EventFilterSpec()
-        events = event_manager.QueryEvents(event_filter)
+        event_filter = vim.event.EventFilterSpec(
+            eventTypeId=["VmPoweredOnEvent", "VmPoweredOffEvent"],
+            time=vim.event.EventFilterSpec.ByTime(beginTime=datetime.now(timezone.utc) - timedelta(days=days))
+        )
+        collector = event_manager.CreateCollectorForEvents(event_filter)
+        try:
+            collector.SetCollectorPageSize(max_events)
+            events = collector.latestPage
+        finally:
+            collector.DestroyCollector()
 
         count = 0
-
-
         for event in events:
-            if hasattr(event, 'vm') and isinstance(event.vm, vim.event.VmEvent):
-                if isinstance(event, (vim.event.VmPoweredOnEvent, vim.event.VmPoweredOffEvent)):
-                    print(f"Time: {event.createdTime}")
-                    print(f"VM: {event.vm.name}")
-                    print(f"User: {event.userName}")
-                    print(f"Event: {type(event).__name__}")
-                    print("-" * 40)
-                    count += 1
-                    if count >= max_events:
-                        break
+            if count >= max_events:
+                break
+            # event.vm is a VmEventArgument (name + VM reference), not a VmEvent
+            vm_name = event.vm.name if event.vm else "N/A"
+            lines.append(f"Time: {event.createdTime}")
+            lines.append(f"VM: {vm_name}")
+            lines.append(f"User: {event.userName}")
+            lines.append(f"Event: {type(event).__name__}")
+            lines.append(SEP40)
+            count += 1
 
         if count == 0:
-            print("No recent VM power events found.")
+            lines.append("No recent VM power events found.")
     except Exception as e:
-        print(f"❌ Failed to retrieve events: {e}")
+        lines.append(f"❌ Failed to retrieve events: {e}")
+    return lines
+
 
-def demo_template():
-    si = connect_to_vcenter()
-    if si:
+def monitor_recent_vm_events(vc, max_events=20, days=1):
+    """
+    Monitors recent vCenter events related to VM power changes.
+
+    Filtering by event type and time window happens on the server, and an
+    EventHistoryCollector page size of max_events caps what is transferred.
+    """
+    if not vc:
+        print("No connection to vCenter.")
+        return
+
+    _write_lines(_vm_event_lines(vc, max_events, days))
+
+async def demo_template(vc):
+    if vc:
         # Step 1: Create a base VM
-        create_vm(si, "TemplateVM")
+        await asyncio.to_thread(create_vm, vc, "TemplateVM")
 
         # Step 2: Convert it to a template
-        convert_vm_to_template(si, "TemplateVM")
+        await asyncio.to_thread(convert_vm_to_template, vc, "TemplateVM")
 
         # Step 3: Clone from the template
-        clone_vm_from_template(si, template_name="TemplateVM", new_vm_name="Shital_ClonedVM")
+        await asyncio.to_thread(clone_vm_from_template, vc, template_name="TemplateVM", new_vm_name="Shital_ClonedVM")
 
-def demo_snapshot():
-    si = connect_to_vcenter()
-    if si:
+async def demo_snapshot(vc):
+    if vc:
         # ---- Check Snapshot functionality ---- #
-        create_vm(si,'Shital_Test_snapshot_VM')
-        control_vm_power(si, "Shital_Test_snapshot_VM", PowerAction.POWER_OFF)
-        take_snapshot(si, "Shital_Test_snapshot_VM", snapshot_name="InitialSnap")
+        await asyncio.to_thread(create_vm, vc, 'Shital_Test_snapshot_VM')
+        await asyncio.to_thread(control_vm_power, vc, "Shital_Test_snapshot_VM", PowerAction.POWER_OFF)
+        await asyncio.to_thread(take_snapshot, vc, "Shital_Test_snapshot_VM", snapshot_name="InitialSnap")
 
         print("🔧 Modifying VM 'Shital_Test_snapshot_VM' memory to simulate change...")
-        content = si.RetrieveContent()
-        containerView = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
-        list_vms(si)
-        for vm in containerView.view:
-            if vm.name == "Shital_Test_snapshot_VM":
-                config_spec = vim.vm.ConfigSpec()
-                config_spec.memoryMB = 256  # Change from 128 to 256
-                task = vm.ReconfigVM_Task(config_spec)
-                while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-                    continue
-                print("✅ VM memory updated.")
-
-
-        #compare_vm_to_snapshot(si, "Shital_Test_snapshot_VM", snapshot_name="InitialSnap")
-        #revert_to_snapshot(si, "Shital_Test_snapshot_VM", snapshot_name="InitialSnap")
-        #clone_vm_from_snapshot(si, "Shital_Test_snapshot_VM", "Clone_shitalVM")
-        delete_vm(si, "Shital_Test_snapshot_VM")
-        delete_vm(si, "Clone_shitalVM")
-        list_vms(si)
-        Disconnect(si)
+        await asyncio.to_thread(list_vms, vc)
+        vm = await asyncio.to_thread(get_vm_by_name, vc, "Shital_Test_snapshot_VM")
+        if vm:
+            config_spec = vim.vm.ConfigSpec()
+            config_spec.memoryMB = 256  # Change from 128 to 256
+            task = await asyncio.to_thread(vm.ReconfigVM_Task, config_spec)
+            await asyncio.to_thread(wait_for_task, vc, task)
+            print("✅ VM memory updated.")
+
+
+        #compare_vm_to_snapshot(vc, "Shital_Test_snapshot_VM", snapshot_name="InitialSnap")
+        #revert_to_snapshot(vc, "Shital_Test_snapshot_VM", snapshot_name="InitialSnap")
+        #clone_vm_from_snapshot(vc, "Shital_Test_snapshot_VM", "Clone_shitalVM")
+        # Kick off both destroys, then wait on them together
+        delete_tasks = await asyncio.gather(
+            asyncio.to_thread(delete_vm, vc, "Shital_Test_snapshot_VM"),
+            asyncio.to_thread(delete_vm, vc, "Clone_shitalVM")
+        )
+        await asyncio.to_thread(wait_for_tasks, vc, [task for task in delete_tasks if task])
+        await asyncio.to_thread(list_vms, vc)
+
+async def demo_vm_creation(vc):
+    if vc:
+        await asyncio.to_thread(create_vm, vc, "Shital_TestVM")
+        await asyncio.to_thread(control_vm_power, vc, "Shital_TestVM", PowerAction.POWER_ON)
+        await asyncio.to_thread(list_vms, vc)
+        await asyncio.to_thread(control_vm_power, vc, "Shital_TestVM", PowerAction.REBOOT)
+        await asyncio.to_thread(control_vm_power, vc, "Shital_TestVM", PowerAction.POWER_OFF)
+        await asyncio.to_thread(delete_vm, vc, "Shital_TestVM")  # Uncomment to delete
+
+async def demo_report(vc):
+    if vc:
+        # Independent read-only reports: overlap their vCenter round-trips,
+        # then print them in a fixed order so the output does not interleave
+        reports = await asyncio.gather(
+            asyncio.to_thread(_vm_inventory_lines, vc),
+            asyncio.to_thread(_datastore_inventory_lines, vc),
+            asyncio.to_thread(_host_health_lines, vc),
+            asyncio.to_thread(_vm_event_lines, vc)
+        )
+        for lines in reports:
+            _write_lines(lines)
+
 
-def demo_vm_creation():
-    si = connect_to_vcenter()
-    if si:
-        create_vm(si, "Shital_TestVM")
-        control_vm_power(si, "Shital_TestVM", PowerAction.POWER_ON)
-        list_vms(si)
-        control_vm_power(si, "Shital_TestVM", PowerAction.REBOOT)
-        control_vm_power(si, "Shital_TestVM", PowerAction.POWER_OFF)
-        delete_vm(si, "Shital_TestVM")  # Uncomment to delete
-
-def demo_report():
-    si = connect_to_vcenter()
-    if si:
-        list_vms(si)
-        list_datastores_with_space(si)
-        report_esxi_hosts_health(si)
-        monitor_recent_vm_events(si)
-
-
-def main():
-    demo_report()
-    demo_vm_creation()
-    demo_snapshot()
-    demo_template()
+async def main():
+    # One session (TLS handshake + login) shared by all demos
+    vc = await asyncio.to_thread(connect_to_vcenter)
+    if not vc:
+        return
+    try:
+        await demo_report(vc)
+        await demo_vm_creation(vc)
+        await demo_snapshot(vc)
+        await demo_template(vc)
+    finally:
+        await asyncio.to_thread(vc.close)
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
 
 